@@ -53,14 +53,21 @@ def get_schema(dataset_type):
         raise ValueError(f"Unknown dataset: {dataset_type}")
 
 
-def load_data(path, dataset_type=None):
-    """Load dataset from parquet file"""
+def load_data(path, dataset_type=None, columns=None):
+    """Load dataset from parquet file (columns: optional subset to read)"""
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
     print(f"📖 Loading {path.name}...")
-    df = pl.read_parquet(path)
+    if columns:
+        # Only read the requested column chunks from the file; columns the
+        # file lacks are added as nulls by enforce_schema below
+        lf = pl.scan_parquet(path)
+        present = lf.collect_schema()
+        df = lf.select([c for c in columns if c in present]).collect(engine="streaming")
+    else:
+        df = pl.read_parquet(path)
 
     # Auto-detect dataset type if not provided
     if dataset_type is None:
@@ -71,7 +78,7 @@ def load_data(path, dataset_type=None):
 
     # Apply schema if type known
     if dataset_type:
-        df = enforce_schema(df, dataset_type)
+        df = enforce_schema(df, dataset_type, columns)
 
     print(f"✅ Loaded {len(df):,} records")
     if "date" in df.columns:
@@ -82,7 +89,7 @@ def load_data(path, dataset_type=None):
 
 
 def save_data(df, path, dataset_type=None):
-    """Save dataset to parquet with compression"""
+    """Save dataset to parquet (LazyFrames are streamed) and return its record count"""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -102,16 +109,31 @@ def save_data(df, path, dataset_type=None):
             df = df.sort(sort_cols)
 
     print(f"💾 Saving to {path.name}...")
-    df.write_parquet(path, compression="brotli", compression_level=11)
-    print(f"✅ Saved {len(df):,} records")
+    # Write a new file and move it over path rather than rewriting path in
+    # place: a lazy plan may still be scanning it, and hardlinked backups
+    # must keep the old contents
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if isinstance(df, pl.LazyFrame):
+        df.sink_parquet(tmp_path, compression="brotli", compression_level=11)
+        tmp_path.replace(path)
+        count = pl.scan_parquet(path).select(pl.len()).collect().item()
+    else:
+        df.write_parquet(tmp_path, compression="brotli", compression_level=11)
+        tmp_path.replace(path)
+        count = len(df)
+    print(f"✅ Saved {count:,} records")
+    return count
 
 
-def enforce_schema(df, dataset_type):
-    """Apply schema to dataframe"""
+def enforce_schema(df, dataset_type, columns=None):
+    """Apply schema to dataframe or lazy frame (columns: optional subset to keep)"""
     schema = get_schema(dataset_type)
+    if columns:
+        schema = {col: dtype for col, dtype in schema.items() if col in columns}
 
+    current = df.collect_schema()
     for col, dtype in schema.items():
-        if col not in df.columns:
+        if col not in current:
             # Add missing column
             if dtype == pl.Categorical:
                 df = df.with_columns(
@@ -121,7 +143,7 @@ def enforce_schema(df, dataset_type):
                 df = df.with_columns(pl.lit(None).cast(dtype).alias(col))
         else:
             # Fix type if needed
-            if df.schema[col] != dtype:
+            if current[col] != dtype:
                 df = df.with_columns(pl.col(col).cast(dtype))
 
     # Ensure column order
@@ -7,7 +7,7 @@ from pathlib import Path
 import argparse
 import sys
 from data_lib import load_data, save_data, get_schema, create_empty
-from repairs_lib import repair_all_orders, get_people_in_new_data
+from repairs_lib import repair_all_orders_lazy, get_people_in_new_data
 
 
 def fetch_forbes_data(session):
@@ -244,11 +244,11 @@ def apply_repairs_pipeline(
         enable_0th/1st/2nd/3rd: Whether to apply specific repair orders
 
     Returns:
-        Repaired dataframe
+        Lazy frame with the repair plan (collect it with pl.collect_all)
     """
     if not enable_repairs:
         print(f"🔄 Skipping repairs for {dataset_type}")
-        return combined_df
+        return combined_df.lazy()
 
     print(f"\n🔧 APPLYING REPAIRS TO {dataset_type.upper()}")
     print("=" * 60)
@@ -270,8 +270,8 @@ def apply_repairs_pipeline(
         # For assets, no person-based optimization needed
         people_filter = None
 
-    # Apply repair pipeline
-    repaired = repair_all_orders(
+    # Build repair pipeline
+    repaired = repair_all_orders_lazy(
         combined_df,
         dataset_type=dataset_type,
         people_filter=people_filter,
@@ -410,7 +410,7 @@ def main():
         print("\n" + "=" * 80)
         print("REPAIR PIPELINE")
 
-        final_billionaires = apply_repairs_pipeline(
+        repaired_billionaires = apply_repairs_pipeline(
             combined_billionaires,
             new_billionaires,
             "billionaires",
@@ -421,7 +421,7 @@ def main():
             enable_3rd,
         )
 
-        final_assets = apply_repairs_pipeline(
+        repaired_assets = apply_repairs_pipeline(
             combined_assets,
             new_assets,
             "assets",
@@ -432,6 +432,11 @@ def main():
             enable_3rd,  # Deduplication for assets
         )
 
+        # Both plans are independent, so run them together
+        final_billionaires, final_assets = pl.collect_all(
+            [repaired_billionaires, repaired_assets], engine="streaming"
+        )
+
         # Save
         print("\n" + "=" * 80)
         print("SAVING DATASETS")
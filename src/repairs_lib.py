@@ -2,25 +2,36 @@
 """Repair functions library for Forbes billionaires dataset"""
 
 import polars as pl
-import re
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Union
 
 pl.enable_string_cache()
+# Keep streaming batches small enough to stay cache resident
+pl.Config.set_streaming_chunk_size(50_000)
 
 
 # ============================================================================
 # 0TH ORDER REPAIRS (Whitespace and Unknown Values)
 # ============================================================================
 
+# Unknown placeholders - only match "unknown" and "unknown_123" style
+UNKNOWN_RE = r"(?i)^unknown(_-?\d+)?$"
+# Leading or trailing whitespace - matches exactly when strip_chars() would
+# change the value, without building the stripped copy
+EDGE_WHITESPACE_RE = r"^\s|\s$"
+
 
 def clean_whitespace_and_unknowns(
-    df: pl.DataFrame, dataset_type: str = None
-) -> pl.DataFrame:
+    df: Union[pl.DataFrame, pl.LazyFrame], dataset_type: str = None
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Clean whitespace and unknown values from string columns.
 
+    For a DataFrame, Categorical columns are cleaned on their distinct values
+    and remapped. A LazyFrame is cleaned row by row instead, so it is never
+    collected here and the result stays a single lazy plan.
+
     Args:
-        df: Input dataframe
+        df: Input dataframe or lazy frame (returned as the same kind)
         dataset_type: Optional dataset type for logging
 
     Returns:
@@ -29,46 +40,61 @@ def clean_whitespace_and_unknowns(
     if dataset_type:
         print(f"🧹 0th order: Cleaning {dataset_type}")
 
-    # Get string columns
-    string_cols = [
-        col for col, dtype in df.schema.items() if dtype in [pl.Utf8, pl.Categorical]
-    ]
+    # Get string columns and their dtypes
+    schema = df.lazy().select(pl.col(pl.Utf8, pl.Categorical)).collect_schema()
+    string_cols = schema.names()
 
     if not string_cols:
         return df
 
-    # Unknown patterns - only match "unknown" and "unknown_123" style
-    patterns = [r"(?i)^unknown$", r"(?i)^unknown_-?\d+$"]
+    def clean_expr(expr: pl.Expr) -> pl.Expr:
+        stripped = expr.str.strip_chars()
+        return (
+            pl.when((stripped == "") | stripped.str.contains(UNKNOWN_RE))
+            .then(None)
+            .otherwise(stripped)
+        )
 
-    def clean_value(val):
-        if val is None:
-            return None
-        cleaned = val.strip()
-        if cleaned == "":
-            return None
-        for pat in patterns:
-            if re.search(pat, cleaned):
-                return None
-        return cleaned
+    # Distinct values of every Categorical column, gathered in one collect;
+    # lazy input skips this so nothing runs before the caller collects
+    distinct = {}
+    if isinstance(df, pl.DataFrame):
+        cat_cols = [col for col in string_cols if schema[col] == pl.Categorical]
+        distinct = dict(
+            zip(
+                cat_cols,
+                pl.collect_all(
+                    [
+                        df.lazy().select(
+                            pl.col(col).cast(pl.Utf8).unique().drop_nulls()
+                        )
+                        for col in cat_cols
+                    ]
+                ),
+            )
+        )
 
     # Clean each column
     exprs = []
     for col in string_cols:
-        dtype = df.schema[col]
-        expr = (
-            pl.col(col)
-            .cast(pl.Utf8)
-            .map_elements(clean_value, return_dtype=pl.Utf8)
-            .cast(dtype)
-            .alias(col)
-        )
+        dtype = schema[col]
+        if col in distinct:
+            # Clean each distinct category once, then remap every row
+            cats = distinct[col].to_series()
+            cleaned_cats = cats.to_frame().select(clean_expr(pl.col(col))).to_series()
+            expr = (
+                pl.col(col)
+                .cast(pl.Utf8)
+                .replace(cats, cleaned_cats)
+                .cast(dtype)
+                .alias(col)
+            )
+        else:
+            expr = clean_expr(pl.col(col).cast(pl.Utf8)).cast(dtype).alias(col)
         exprs.append(expr)
 
-    # Add non-string columns
-    non_string = [col for col in df.columns if col not in string_cols]
-    all_exprs = [pl.col(col) for col in non_string] + exprs
-
-    cleaned = df.select(all_exprs)
+    # Only rewrite the string columns, leaving the rest untouched
+    cleaned = df.with_columns(exprs)
 
     if dataset_type:
         print(f"   ✓ Cleaned {len(string_cols)} string columns")
@@ -76,35 +102,42 @@ def clean_whitespace_and_unknowns(
     return cleaned
 
 
-def count_0th_order_issues(df: pl.DataFrame) -> Dict[str, int]:
-    """Count 0th order issues in dataframe"""
-    string_cols = [
-        col for col, dtype in df.schema.items() if dtype in (pl.Utf8, pl.Categorical)
-    ]
+def count_0th_order_query(df: Union[pl.DataFrame, pl.LazyFrame]) -> pl.LazyFrame:
+    """Build a lazy one-row frame with the whitespace and unknown totals"""
+    lf = df.lazy()
+    string_cols = lf.select(pl.col(pl.Utf8, pl.Categorical)).collect_schema().names()
 
     if not string_cols:
-        return {"whitespace": 0, "unknown": 0}
-
-    unk_pattern = r"(?i)^(unknown|unknown_-?\d+)$"
-    whitespace = unknown = 0
+        return lf.select(
+            pl.lit(0, dtype=pl.Int64).alias("whitespace"),
+            pl.lit(0, dtype=pl.Int64).alias("unknown"),
+        )
 
+    # One reduction per column and issue type, evaluated in a single pass
+    whitespace_exprs = []
+    unknown_exprs = []
     for col in string_cols:
         col_str = pl.col(col).cast(pl.Utf8)
+        whitespace_exprs.append(
+            (col_str.is_not_null() & col_str.str.contains(EDGE_WHITESPACE_RE))
+            .sum()
+            .cast(pl.Int64)
+        )
+        unknown_exprs.append(
+            (col_str.is_not_null() & col_str.str.contains(UNKNOWN_RE))
+            .sum()
+            .cast(pl.Int64)
+        )
 
-        # Whitespace issues
-        ws = df.filter(
-            col_str.is_not_null() & (col_str != col_str.str.strip_chars())
-        ).height
-
-        # Unknown variations
-        unk = df.filter(
-            col_str.is_not_null() & col_str.str.contains(unk_pattern)
-        ).height
+    return lf.select(
+        pl.sum_horizontal(whitespace_exprs).alias("whitespace"),
+        pl.sum_horizontal(unknown_exprs).alias("unknown"),
+    )
 
-        whitespace += ws
-        unknown += unk
 
-    return {"whitespace": whitespace, "unknown": unknown}
+def count_0th_order_issues(df: Union[pl.DataFrame, pl.LazyFrame]) -> Dict[str, int]:
+    """Count 0th order issues in a dataframe or lazy frame (one streaming pass)"""
+    return count_0th_order_query(df).collect(engine="streaming").row(0, named=True)
 
 
 # ============================================================================
@@ -112,29 +145,25 @@ def count_0th_order_issues(df: pl.DataFrame) -> Dict[str, int]:
 # ============================================================================
 
 
-def find_canonical_identity_values(
-    df: pl.DataFrame, id_keys: List[str] = None, fix_fields: List[str] = None
-) -> pl.DataFrame:
+def people_filter_mask(
+    df: Union[pl.DataFrame, pl.LazyFrame], people_filter: List[str]
+) -> pl.Expr:
     """
-    Find canonical identity values for each person.
+    Boolean expression selecting the rows of the people in people_filter.
 
-    Args:
-        df: Input dataframe
-        id_keys: Keys to identify unique persons (default: ["personName"])
-        fix_fields: Fields to fix (default: ["lastName", "birthDate", "gender"])
-
-    Returns:
-        Dataframe with canonical values
+    The people are encoded once with the personName dtype, so a Categorical
+    column is probed with category IDs instead of a Python list of strings.
     """
-    if id_keys is None:
-        id_keys = ["personName"]
-    if fix_fields is None:
-        fix_fields = ["lastName", "birthDate", "gender"]
+    dtype = df.collect_schema()["personName"]
+    people = pl.Series("personName", people_filter, dtype=pl.Utf8).cast(dtype)
+    return pl.col("personName").is_in(people)
 
-    print(f"🔍 1st order: Finding canonical values for {', '.join(fix_fields)}")
 
-    # Clean empty strings
-    df_clean = df.with_columns(
+def clean_identity_empty_strings(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Convert empty strings to nulls for identity fields"""
+    return df.with_columns(
         [
             pl.when(pl.col("lastName") == "")
             .then(None)
@@ -147,57 +176,73 @@ def find_canonical_identity_values(
         ]
     )
 
-    # Get unique identities
-    unique_ids = df_clean.select(id_keys).unique()
-    canonical = []
 
-    for id_row in unique_ids.iter_rows(named=True):
-        # Build filter for this person
-        filter_expr = None
-        for key in id_keys:
-            val = id_row[key]
-            cond = pl.col(key).is_null() if val is None else pl.col(key) == val
-            filter_expr = cond if filter_expr is None else filter_expr & cond
+def find_canonical_identity_values(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    id_keys: List[str] = None,
+    fix_fields: List[str] = None,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Find canonical identity values for each person.
 
-        person_data = df_clean.filter(filter_expr).sort("date", descending=True)
-        if len(person_data) == 0:
-            continue
+    Args:
+        df: Input dataframe, already passed through clean_identity_empty_strings
+        id_keys: Keys to identify unique persons (default: ["personName"])
+        fix_fields: Fields to fix (default: ["lastName", "birthDate", "gender"])
+
+    Returns:
+        Dataframe with canonical values (lazy if df is lazy)
+    """
+    if id_keys is None:
+        id_keys = ["personName"]
+    if fix_fields is None:
+        fix_fields = ["lastName", "birthDate", "gender"]
 
-        # Build canonical record
-        rec = {col: id_row[col] for col in id_keys}
+    print(f"🔍 1st order: Finding canonical values for {', '.join(fix_fields)}")
 
-        # Get most recent non-null value for each field
-        for field in fix_fields:
-            if field in df.columns:
-                non_null = person_data.filter(pl.col(field).is_not_null())
-                rec[field] = non_null[field][0] if len(non_null) > 0 else None
+    columns = df.collect_schema().names()
 
-        canonical.append(rec)
+    # Most recent non-null value for each field, per identity
+    canonical_df = (
+        df.lazy()
+        .group_by(id_keys)
+        .agg(
+            [
+                pl.col(field)
+                .sort_by("date", descending=True)
+                .drop_nulls()
+                .first()
+                .alias(field)
+                for field in fix_fields
+                if field in columns
+            ]
+        )
+    )
 
-    # Convert to dataframe with matching types
-    canonical_df = pl.DataFrame(canonical)
-    for col in id_keys + fix_fields:
-        if col in df.columns and col in canonical_df.columns:
-            canonical_df = canonical_df.with_columns(pl.col(col).cast(df.schema[col]))
+    if isinstance(df, pl.LazyFrame):
+        return canonical_df
 
+    canonical_df = canonical_df.collect()
     print(f"   ✓ Found canonical values for {len(canonical_df):,} identities")
     return canonical_df
 
 
 def apply_identity_fixes(
-    df: pl.DataFrame,
-    canonical_df: pl.DataFrame,
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    canonical_df: Union[pl.DataFrame, pl.LazyFrame],
     id_keys: List[str] = None,
     fix_fields: List[str] = None,
-) -> pl.DataFrame:
+    mask: Optional[pl.Expr] = None,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Apply canonical identity values to dataframe.
 
     Args:
-        df: Input dataframe
+        df: Input dataframe, already passed through clean_identity_empty_strings
         canonical_df: Canonical values dataframe
         id_keys: Keys to join on
         fix_fields: Fields to fix
+        mask: Optional boolean expression; rows outside it keep their values
 
     Returns:
         Fixed dataframe
@@ -209,47 +254,39 @@ def apply_identity_fixes(
 
     print(f"🔧 1st order: Applying identity fixes")
 
-    # Clean empty strings in original
-    df_clean = df.with_columns(
-        [
-            pl.when(pl.col("lastName") == "")
-            .then(None)
-            .otherwise(pl.col("lastName"))
-            .alias("lastName"),
-            pl.when(pl.col("gender") == "")
-            .then(None)
-            .otherwise(pl.col("gender"))
-            .alias("gender"),
-        ]
-    )
-
     # Prepare canonical for join
+    canonical_cols = canonical_df.collect_schema().names()
     rename_dict = {
-        field: f"new_{field}" for field in fix_fields if field in canonical_df.columns
+        field: f"new_{field}" for field in fix_fields if field in canonical_cols
     }
     canonical_join = canonical_df.select(id_keys + list(rename_dict.keys())).rename(
         rename_dict
     )
 
     # Join and replace
-    fixed = df_clean.join(canonical_join, on=id_keys, how="left")
-
-    # Replace with canonical values
-    for field in fix_fields:
-        if f"new_{field}" in fixed.columns:
-            fixed = fixed.with_columns(pl.col(f"new_{field}").alias(field))
-            fixed = fixed.drop(f"new_{field}")
+    if isinstance(df, pl.LazyFrame):
+        canonical_join = canonical_join.lazy()
+    fixed = df.join(canonical_join, on=id_keys, how="left")
+
+    # Replace with canonical values in one pass
+    new_values = []
+    for field, new_field in rename_dict.items():
+        new_value = pl.col(new_field)
+        if mask is not None:
+            new_value = pl.when(mask).then(new_value).otherwise(pl.col(field))
+        new_values.append(new_value.alias(field))
+    fixed = fixed.with_columns(new_values).drop(list(rename_dict.values()))
 
     print(f"   ✓ Applied identity fixes")
     return fixed
 
 
 def repair_identity_consistency(
-    df: pl.DataFrame,
+    df: Union[pl.DataFrame, pl.LazyFrame],
     id_keys: List[str] = None,
     fix_fields: List[str] = None,
     people_filter: Optional[List[str]] = None,
-) -> pl.DataFrame:
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Complete identity consistency repair pipeline.
 
@@ -264,27 +301,20 @@ def repair_identity_consistency(
     """
     if people_filter:
         print(f"🎯 1st order: Focusing on {len(people_filter)} people")
-        # Get data for these people plus some historical context
-        relevant_data = df.filter(pl.col("personName").is_in(people_filter))
-        other_data = df.filter(~pl.col("personName").is_in(people_filter))
-    else:
-        relevant_data = df
-        other_data = None
+        in_filter = people_filter_mask(df, people_filter)
+        relevant_data = clean_identity_empty_strings(df.filter(in_filter))
 
-    # Find canonical values (using relevant data)
-    canonical = find_canonical_identity_values(relevant_data, id_keys, fix_fields)
+        # Canonical values come from these people only, and only their rows
+        # are rewritten, so the rest of the frame needs no split and concat
+        canonical = find_canonical_identity_values(relevant_data, id_keys, fix_fields)
+        return apply_identity_fixes(df, canonical, id_keys, fix_fields, in_filter)
 
-    # Apply fixes
-    if other_data is not None:
-        # Apply fixes only to relevant data, then recombine
-        fixed_relevant = apply_identity_fixes(
-            relevant_data, canonical, id_keys, fix_fields
-        )
-        result = pl.concat([other_data, fixed_relevant], how="vertical_relaxed")
-    else:
-        result = apply_identity_fixes(df, canonical, id_keys, fix_fields)
+    # Clean empty strings once for both the lookup and the fixes
+    relevant_data = clean_identity_empty_strings(df)
 
-    return result
+    # Find canonical values and apply them
+    canonical = find_canonical_identity_values(relevant_data, id_keys, fix_fields)
+    return apply_identity_fixes(relevant_data, canonical, id_keys, fix_fields)
 
 
 # ============================================================================
@@ -292,54 +322,34 @@ def repair_identity_consistency(
 # ============================================================================
 
 
-def clean_second_order_empty_strings(
-    df: pl.DataFrame,
-) -> Tuple[pl.DataFrame, List[str]]:
-    """Convert empty strings to nulls for second order fields"""
-    fields = ["countryOfCitizenship", "city", "state", "source", "industries"]
-    existing = [f for f in fields if f in df.columns]
-
-    if not existing:
-        return df, []
-
-    print(f"🧹 2nd order: Converting empty strings to nulls")
-
-    df_clean = df.with_columns(
-        [
-            pl.when(pl.col(f) == "").then(None).otherwise(pl.col(f)).alias(f)
-            for f in existing
-        ]
+def forward_backward_fill_expr(field: str, empty_as_null: bool = False) -> pl.Expr:
+    """
+    Forward then backward fill a field within each person, in date order.
+    With empty_as_null, empty strings are treated as missing and filled too.
+    """
+    value = pl.col(field)
+    if empty_as_null:
+        value = pl.when(value == "").then(None).otherwise(value)
+    return (
+        value.fill_null(strategy="forward")
+        .fill_null(strategy="backward")
+        .over("personName", order_by="date")
+        .alias(field)
     )
 
-    return df_clean, existing
 
-
-def apply_forward_backward_fill(df: pl.DataFrame, field: str) -> pl.DataFrame:
+def apply_forward_backward_fill(
+    df: Union[pl.DataFrame, pl.LazyFrame], field: str
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Apply forward/backward fill to a specific field"""
-    # Forward fill
-    df_fwd = df.with_columns(
-        pl.col(field)
-        .fill_null(strategy="forward")
-        .over("personName")
-        .alias(f"{field}_tmp")
-    )
-
-    # Backward fill remaining
-    df_filled = df_fwd.with_columns(
-        pl.col(f"{field}_tmp")
-        .fill_null(strategy="backward")
-        .over("personName")
-        .alias(field)
-    ).drop(f"{field}_tmp")
-
-    return df_filled
+    return df.with_columns(forward_backward_fill_expr(field))
 
 
 def repair_second_order_fields(
-    df: pl.DataFrame,
+    df: Union[pl.DataFrame, pl.LazyFrame],
     fields: List[str] = None,
     people_filter: Optional[List[str]] = None,
-) -> pl.DataFrame:
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Repair second order fields using forward/backward fill.
 
@@ -353,15 +363,20 @@ def repair_second_order_fields(
     """
     print(f"🔧 2nd order: Forward/backward fill repair")
 
-    # Clean empty strings and get fields
+    # Whole people are either in or out of the filter, so masking the fill
+    # per row repairs the same rows as splitting the frame would
+    in_filter = None
     if people_filter:
         print(f"🎯 2nd order: Focusing on {len(people_filter)} people")
-        relevant_data = df.filter(pl.col("personName").is_in(people_filter))
-        other_data = df.filter(~pl.col("personName").is_in(people_filter))
-        df_clean, repair_fields = clean_second_order_empty_strings(relevant_data)
-    else:
-        df_clean, repair_fields = clean_second_order_empty_strings(df)
-        other_data = None
+        in_filter = people_filter_mask(df, people_filter)
+
+    # Second order fields present in this frame
+    columns = df.collect_schema().names()
+    repair_fields = [
+        f
+        for f in ["countryOfCitizenship", "city", "state", "source", "industries"]
+        if f in columns
+    ]
 
     if fields:
         repair_fields = [f for f in fields if f in repair_fields]
@@ -370,19 +385,18 @@ def repair_second_order_fields(
         print("   ⚠️ No fields to repair")
         return df
 
-    # Sort by person and date
-    df_sorted = df_clean.sort(["personName", "date"])
-
-    # Apply fill to each field
-    repaired = df_sorted
-    for field in repair_fields:
-        repaired = apply_forward_backward_fill(repaired, field)
+    # Clean empty strings and fill all fields in one pass
+    fill_exprs = [
+        forward_backward_fill_expr(field, empty_as_null=True) for field in repair_fields
+    ]
+    if in_filter is not None:
+        fill_exprs = [
+            pl.when(in_filter).then(expr).otherwise(pl.col(field)).alias(field)
+            for field, expr in zip(repair_fields, fill_exprs)
+        ]
 
-    # Combine with other data if we filtered
-    if other_data is not None:
-        result = pl.concat([other_data, repaired], how="vertical_relaxed")
-    else:
-        result = repaired
+    # The window orders each person by date itself, so no global sort is needed
+    result = df.with_columns(fill_exprs)
 
     print(f"   ✓ Applied fill to {len(repair_fields)} fields")
     return result
@@ -393,27 +407,33 @@ def repair_second_order_fields(
 # ============================================================================
 
 
+MISSING_IDENTIFIERS = {
+    # Both personName and lastName are missing/empty
+    "billionaires": pl.col("personName").is_null() & pl.col("lastName").is_null(),
+    # personName is missing
+    "assets": pl.col("personName").is_null(),
+}
+
+
 def clean_and_prepare_for_deduplication(
-    df: pl.DataFrame, dataset_type: str
-) -> pl.DataFrame:
+    df: Union[pl.DataFrame, pl.LazyFrame], dataset_type: str
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Clean data and prepare for deduplication.
     Remove records with missing essential identifiers.
     """
     print(f"🧹 3rd order: Preparing {dataset_type} for deduplication")
 
-    if dataset_type == "billionaires":
-        # Remove records where BOTH personName and lastName are missing/empty
-        condition = (pl.col("personName").is_null()) & (pl.col("lastName").is_null())
-        df_clean = df.filter(~condition)
-    elif dataset_type == "assets":
-        # Remove records with missing personName
-        condition = pl.col("personName").is_null()
-        df_clean = df.filter(~condition)
-    else:
+    if dataset_type not in MISSING_IDENTIFIERS:
         print(f"   ⚠️ Unknown dataset type: {dataset_type}")
         return df
 
+    df_clean = df.filter(~MISSING_IDENTIFIERS[dataset_type])
+
+    # Lazy input is reported by report_deduplication once it is collected
+    if isinstance(df, pl.LazyFrame):
+        return df_clean
+
     removed = len(df) - len(df_clean)
     if removed > 0:
         print(f"   ⚠️  Removed {removed:,} records with missing identifiers")
@@ -421,44 +441,108 @@ def clean_and_prepare_for_deduplication(
     return df_clean
 
 
-def deduplicate_billionaires(df: pl.DataFrame) -> pl.DataFrame:
+DEDUP_KEYS = {
+    "billionaires": ["date", "personName"],
+    "assets": [
+        "date",
+        "personName",
+        "ticker",
+        "companyName",
+        "currencyCode",
+        "exchange",
+        "interactive",
+        "exchangeRate",
+        "exerciseOptionPrice",
+    ],
+}
+
+
+def build_dedup_key(
+    df: Union[pl.DataFrame, pl.LazyFrame], dataset_type: str
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Attach the deduplication key for a dataset type as a dedup_key column.
+
+    The key is a u64 row hash of the DEDUP_KEYS columns, so grouping on it
+    compares integers instead of long concatenated strings. Missing string
+    values are hashed as empty strings, so null and "" count as the same key.
+    Categorical key columns are hashed as they are rather than decoded back
+    to strings.
+    """
+    key_values = dedup_key_values(df, dataset_type)
+    return df.with_columns(key_values.hash(seed=0).alias("dedup_key"))
+
+
+def dedup_key_values(
+    df: Union[pl.DataFrame, pl.LazyFrame], dataset_type: str
+) -> pl.Expr:
+    """
+    Struct of the normalized DEDUP_KEYS columns that dedup_key hashes.
+
+    Missing string values become empty strings, so null and "" count as the
+    same key.
+    """
+    if dataset_type not in DEDUP_KEYS:
+        raise ValueError(f"Unknown dataset: {dataset_type}")
+
+    schema = df.collect_schema()
+    key_exprs = [
+        (
+            pl.col(col).fill_null("")
+            if schema[col] in (pl.Utf8, pl.Categorical)
+            else pl.col(col)
+        )
+        for col in DEDUP_KEYS[dataset_type]
+    ]
+    return pl.struct(key_exprs).alias("dedup_values")
+
+
+def dedup_groups(
+    df: Union[pl.DataFrame, pl.LazyFrame], dataset_type: str
+) -> List[pl.Expr]:
+    """
+    Group keys for deduplication: the dedup_key hash plus the key values it
+    was built from, so a hash collision can never merge two different records.
+    """
+    return [pl.col("dedup_key"), dedup_key_values(df, dataset_type)]
+
+
+def deduplicate_billionaires(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Deduplicate billionaires data keeping the record with highest finalWorth.
 
-    Deduplication key: date|personName|lastName
-    Sort criterion: finalWorth (highest first)
+    Deduplication key: date, personName (grouped on their hash and values)
+    Ranking criterion: finalWorth (highest kept)
     """
     print("🔄 3rd order: Deduplicating billionaires...")
 
-    # Create deduplication key
-    df_keyed = df.with_columns(
-        pl.concat_str(
-            [
-                pl.col("date").cast(pl.Utf8),
-                pl.col("personName").fill_null(""),
-            ],
-            separator="|",
-        ).alias("dedup_key")
-    )
+    # Reuse the deduplication key if the caller already built it
+    if "dedup_key" not in df.collect_schema().names():
+        df = build_dedup_key(df, "billionaires")
 
-    # Convert finalWorth to decimal for proper sorting
-    df_keyed = df_keyed.with_columns(
+    # Treat a missing finalWorth as 0 when ranking records
+    worth = (
         pl.when(pl.col("finalWorth").is_null())
         .then(pl.lit(0).cast(pl.Decimal(precision=18, scale=8)))
         .otherwise(pl.col("finalWorth"))
-        .alias("finalWorth_for_sort")
     )
 
-    # Sort by dedup_key (ascending) and finalWorth (descending - highest first)
-    df_sorted = df_keyed.sort(
-        ["dedup_key", "finalWorth_for_sort"], descending=[False, True]
+    # Pick the winning row per key from (key, row index, finalWorth) only,
+    # then keep those rows, so the wide string columns are never shuffled
+    row_idx = pl.col("row_idx")
+    df_final = (
+        df.with_row_index("row_idx")
+        .filter(
+            row_idx
+            == row_idx.get(worth.arg_max()).over(dedup_groups(df, "billionaires"))
+        )
+        .drop(["row_idx", "dedup_key"])
     )
 
-    # Keep first record for each dedup_key (which is the one with highest finalWorth)
-    df_deduped = df_sorted.unique(subset=["dedup_key"], keep="first")
-
-    # Remove temporary columns
-    df_final = df_deduped.drop(["dedup_key", "finalWorth_for_sort"])
+    if isinstance(df_final, pl.LazyFrame):
+        return df_final
 
     removed = len(df) - len(df_final)
     print(f"   ✅ Removed {removed:,} duplicate records")
@@ -466,51 +550,43 @@ def deduplicate_billionaires(df: pl.DataFrame) -> pl.DataFrame:
     return df_final
 
 
-def deduplicate_assets(df: pl.DataFrame) -> pl.DataFrame:
+def deduplicate_assets(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Deduplicate assets data keeping the record with highest numberOfShares.
 
-    Deduplication key: date|personName|ticker|companyName|currencyCode|exchange|interactive|exchangeRate|exerciseOptionPrice
-    Sort criterion: numberOfShares (highest first)
+    Deduplication key: date, personName, ticker, companyName, currencyCode,
+    exchange, interactive, exchangeRate, exerciseOptionPrice (grouped on their
+    hash and values)
+    Ranking criterion: numberOfShares (highest kept)
     """
     print("🔄 3rd order: Deduplicating assets...")
 
-    # Create comprehensive deduplication key
-    df_keyed = df.with_columns(
-        pl.concat_str(
-            [
-                pl.col("date").cast(pl.Utf8),
-                pl.col("personName").fill_null(""),
-                pl.col("ticker").fill_null(""),
-                pl.col("companyName").fill_null(""),
-                pl.col("currencyCode").fill_null(""),
-                pl.col("exchange").fill_null(""),
-                pl.col("interactive").cast(pl.Utf8).fill_null(""),
-                pl.col("exchangeRate").cast(pl.Utf8).fill_null(""),
-                pl.col("exerciseOptionPrice").cast(pl.Utf8).fill_null(""),
-            ],
-            separator="|",
-        ).alias("dedup_key")
-    )
+    # Reuse the deduplication key if the caller already built it
+    if "dedup_key" not in df.collect_schema().names():
+        df = build_dedup_key(df, "assets")
 
-    # Convert numberOfShares to decimal for proper sorting
-    df_keyed = df_keyed.with_columns(
+    # Treat a missing numberOfShares as 0 when ranking records
+    shares = (
         pl.when(pl.col("numberOfShares").is_null())
         .then(pl.lit(0).cast(pl.Decimal(precision=18, scale=2)))
         .otherwise(pl.col("numberOfShares"))
-        .alias("numberOfShares_for_sort")
     )
 
-    # Sort by dedup_key (ascending) and numberOfShares (descending - highest first)
-    df_sorted = df_keyed.sort(
-        ["dedup_key", "numberOfShares_for_sort"], descending=[False, True]
+    # Pick the winning row per key from (key, row index, numberOfShares) only,
+    # then keep those rows, so the wide string columns are never shuffled
+    row_idx = pl.col("row_idx")
+    df_final = (
+        df.with_row_index("row_idx")
+        .filter(
+            row_idx == row_idx.get(shares.arg_max()).over(dedup_groups(df, "assets"))
+        )
+        .drop(["row_idx", "dedup_key"])
     )
 
-    # Keep first record for each dedup_key (which is the one with highest numberOfShares)
-    df_deduped = df_sorted.unique(subset=["dedup_key"], keep="first")
-
-    # Remove temporary columns
-    df_final = df_deduped.drop(["dedup_key", "numberOfShares_for_sort"])
+    if isinstance(df_final, pl.LazyFrame):
+        return df_final
 
     removed = len(df) - len(df_final)
     print(f"   ✅ Removed {removed:,} duplicate records")
@@ -519,9 +595,9 @@ def deduplicate_assets(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def repair_deduplication(
-    df: pl.DataFrame,
+    df: Union[pl.DataFrame, pl.LazyFrame],
     dataset_type: str,
-) -> pl.DataFrame:
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """
     Complete deduplication repair pipeline.
 
@@ -537,18 +613,41 @@ def repair_deduplication(
     # Clean and prepare
     df_clean = clean_and_prepare_for_deduplication(df, dataset_type)
 
+    if dataset_type not in ("billionaires", "assets"):
+        print(f"   ⚠️ Unsupported dataset type: {dataset_type}")
+        return df
+
+    # Build the deduplication key once
+    df_keyed = build_dedup_key(df_clean, dataset_type)
+
     # Apply deduplication based on dataset type
     if dataset_type == "billionaires":
-        result = deduplicate_billionaires(df_clean)
-    elif dataset_type == "assets":
-        result = deduplicate_assets(df_clean)
+        result = deduplicate_billionaires(df_keyed)
     else:
-        print(f"   ⚠️ Unsupported dataset type: {dataset_type}")
-        return df
+        result = deduplicate_assets(df_keyed)
 
     return result
 
 
+def deduplication_counts_query(
+    df: Union[pl.DataFrame, pl.LazyFrame], dataset_type: str
+) -> pl.LazyFrame:
+    """Build a lazy one-row frame with the records and missing identifiers
+    of a frame about to go through repair_deduplication"""
+    return df.lazy().select(
+        pl.len().alias("records"),
+        MISSING_IDENTIFIERS[dataset_type].sum().alias("missing_identifiers"),
+    )
+
+
+def report_deduplication(counts: pl.DataFrame, deduplicated_count: int) -> None:
+    """Print what a lazy repair_deduplication removed, once it is collected"""
+    records, missing = counts.row(0)
+    if missing > 0:
+        print(f"   ⚠️  Removed {missing:,} records with missing identifiers")
+    print(f"   ✅ Removed {records - missing - deduplicated_count:,} duplicate records")
+
+
 def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
     """Analyze duplicate patterns before deduplication"""
     print(f"\n🔍 DUPLICATE ANALYSIS - {dataset_type.upper()}")
@@ -556,29 +655,29 @@ def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
 
     stats = {"dataset_type": dataset_type, "total_records": len(df)}
 
+    if dataset_type not in ("billionaires", "assets"):
+        return stats
+
+    # Reuse the deduplication key if the caller already built it
+    df_keyed = (
+        df
+        if "dedup_key" in df.collect_schema().names()
+        else build_dedup_key(df, dataset_type)
+    )
+
     if dataset_type == "billionaires":
         # Group by dedup key to find duplicates
         duplicates = (
-            df.with_columns(
-                pl.concat_str(
-                    [
-                        pl.col("date").cast(pl.Utf8),
-                        pl.col("personName").fill_null(""),
-                    ],
-                    separator="|",
-                ).alias("dedup_key")
-            )
-            .group_by("dedup_key")
+            df_keyed.group_by(dedup_groups(df_keyed, dataset_type))
             .agg(
                 [
-                    pl.count().alias("count"),
+                    pl.len().alias("count"),
                     pl.col("personName").first().alias("person"),
                     pl.col("finalWorth").min().alias("min_worth"),
                     pl.col("finalWorth").max().alias("max_worth"),
                 ]
             )
             .filter(pl.col("count") > 1)
-            .sort("count", descending=True)
         )
 
         stats["duplicate_groups"] = len(duplicates)
@@ -589,9 +688,15 @@ def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
         if len(duplicates) > 0:
             print(f"Found {len(duplicates):,} duplicate groups")
             print("Top duplicate examples:")
-            for row in duplicates.head(5).iter_rows(named=True):
+            # Only the displayed examples need ordering
+            top_duplicates = duplicates.top_k(5, by="count").sort(
+                "count", descending=True
+            )
+            for person, count, min_worth, max_worth in top_duplicates.select(
+                ["person", "count", "min_worth", "max_worth"]
+            ).iter_rows():
                 print(
-                    f"  👤 {row['person']}: {row['count']} records, worth {row['min_worth']} - {row['max_worth']}"
+                    f"  👤 {person}: {count} records, worth {min_worth} - {max_worth}"
                 )
         else:
             print("✅ No duplicates found")
@@ -599,26 +704,10 @@ def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
     elif dataset_type == "assets":
         # Group by dedup key to find duplicates
         duplicates = (
-            df.with_columns(
-                pl.concat_str(
-                    [
-                        pl.col("date").cast(pl.Utf8),
-                        pl.col("personName").fill_null(""),
-                        pl.col("ticker").fill_null(""),
-                        pl.col("companyName").fill_null(""),
-                        pl.col("currencyCode").fill_null(""),
-                        pl.col("exchange").fill_null(""),
-                        pl.col("interactive").cast(pl.Utf8).fill_null(""),
-                        pl.col("exchangeRate").cast(pl.Utf8).fill_null(""),
-                        pl.col("exerciseOptionPrice").cast(pl.Utf8).fill_null(""),
-                    ],
-                    separator="|",
-                ).alias("dedup_key")
-            )
-            .group_by("dedup_key")
+            df_keyed.group_by(dedup_groups(df_keyed, dataset_type))
             .agg(
                 [
-                    pl.count().alias("count"),
+                    pl.len().alias("count"),
                     pl.col("personName").first().alias("person"),
                     pl.col("ticker").first().alias("ticker"),
                     pl.col("numberOfShares").min().alias("min_shares"),
@@ -626,7 +715,6 @@ def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
                 ]
             )
             .filter(pl.col("count") > 1)
-            .sort("count", descending=True)
         )
 
         stats["duplicate_groups"] = len(duplicates)
@@ -637,9 +725,15 @@ def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
         if len(duplicates) > 0:
             print(f"Found {len(duplicates):,} duplicate groups")
             print("Top duplicate examples:")
-            for row in duplicates.head(5).iter_rows(named=True):
+            # Only the displayed examples need ordering
+            top_duplicates = duplicates.top_k(5, by="count").sort(
+                "count", descending=True
+            )
+            for person, ticker, count, min_shares, max_shares in top_duplicates.select(
+                ["person", "ticker", "count", "min_shares", "max_shares"]
+            ).iter_rows():
                 print(
-                    f"  💰 {row['person']} - {row['ticker']}: {row['count']} records, {row['min_shares']} - {row['max_shares']} shares"
+                    f"  💰 {person} - {ticker}: {count} records, {min_shares} - {max_shares} shares"
                 )
         else:
             print("✅ No duplicates found")
@@ -652,6 +746,44 @@ def analyze_duplicates(df: pl.DataFrame, dataset_type: str) -> Dict:
 # ============================================================================
 
 
+def repair_all_orders_lazy(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    dataset_type: str = "billionaires",
+    people_filter: Optional[List[str]] = None,
+    apply_0th: bool = True,
+    apply_1st: bool = True,
+    apply_2nd: bool = True,
+    apply_3rd: bool = True,
+) -> pl.LazyFrame:
+    """
+    Build all repair orders into one lazy plan without collecting it.
+
+    Takes the same arguments as repair_all_orders. Independent plans (e.g.
+    billionaires and assets) can then be run together with pl.collect_all.
+    A LazyFrame is never collected here; a DataFrame already in memory gets
+    its 0th order cleaning applied up front, on its distinct categories.
+    """
+    result = df.lazy()
+
+    # 0th Order: Clean whitespace and unknowns (always apply to all data)
+    if apply_0th:
+        result = clean_whitespace_and_unknowns(df, dataset_type).lazy()
+
+    # 1st Order: Identity consistency (can be optimized with people_filter)
+    if apply_1st and dataset_type == "billionaires":
+        result = repair_identity_consistency(result, people_filter=people_filter)
+
+    # 2nd Order: Forward/backward fill (can be optimized with people_filter)
+    if apply_2nd and dataset_type == "billionaires":
+        result = repair_second_order_fields(result, people_filter=people_filter)
+
+    # 3rd Order: Deduplication (always apply to all data)
+    if apply_3rd:
+        result = repair_deduplication(result, dataset_type)
+
+    return result
+
+
 def repair_all_orders(
     df: pl.DataFrame,
     dataset_type: str = "billionaires",
@@ -679,23 +811,31 @@ def repair_all_orders(
     print(f"\n🔧 INTEGRATED REPAIR PIPELINE - {dataset_type}")
     print("=" * 60)
 
-    result = df
-
-    # 0th Order: Clean whitespace and unknowns (always apply to all data)
-    if apply_0th:
-        result = clean_whitespace_and_unknowns(result, dataset_type)
-
-    # 1st Order: Identity consistency (can be optimized with people_filter)
-    if apply_1st and dataset_type == "billionaires":
-        result = repair_identity_consistency(result, people_filter=people_filter)
-
-    # 2nd Order: Forward/backward fill (can be optimized with people_filter)
-    if apply_2nd and dataset_type == "billionaires":
-        result = repair_second_order_fields(result, people_filter=people_filter)
+    # Build every order into one lazy plan and collect it once at the end
+    before_3rd = repair_all_orders_lazy(
+        df,
+        dataset_type,
+        people_filter=people_filter,
+        apply_0th=apply_0th,
+        apply_1st=apply_1st,
+        apply_2nd=apply_2nd,
+        apply_3rd=False,
+    )
+    result = repair_deduplication(before_3rd, dataset_type) if apply_3rd else before_3rd
+
+    # No stage needs a global sort any more, so stream the plan in batches;
+    # what deduplication removes is counted in the same collect
+    if apply_3rd and dataset_type in MISSING_IDENTIFIERS:
+        result, dedup_counts = pl.collect_all(
+            [result, deduplication_counts_query(before_3rd, dataset_type)],
+            engine="streaming",
+        )
+        report_deduplication(dedup_counts, len(result))
+    else:
+        result = result.collect(engine="streaming")
 
-    # 3rd Order: Deduplication (always apply to all data)
     if apply_3rd:
-        result = repair_deduplication(result, dataset_type)
+        print(f"   ✅ Removed {len(df) - len(result):,} records in total")
 
     print(f"✅ Repair pipeline completed for {len(result):,} records")
     return result
@@ -716,6 +856,150 @@ def get_people_in_new_data(new_df: pl.DataFrame) -> List[str]:
 # ============================================================================
 
 
+IDENTITY_FIELDS = ["lastName", "birthDate", "gender"]
+FILL_FIELDS = ["countryOfCitizenship", "city", "state", "source", "industries"]
+
+
+def empty_strings_to_null(
+    df: Union[pl.DataFrame, pl.LazyFrame], fields: List[str]
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Convert empty strings to nulls in the string columns among fields"""
+    schema = df.collect_schema()
+    return df.with_columns(
+        [
+            pl.when(pl.col(field) == "")
+            .then(None)
+            .otherwise(pl.col(field))
+            .alias(field)
+            for field in fields
+            if field in schema and schema[field] in (pl.Utf8, pl.Categorical)
+        ]
+    )
+
+
+def person_field_counts_query(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    identity_fields: List[str] = IDENTITY_FIELDS,
+    fill_fields: List[str] = FILL_FIELDS,
+    conflicts_only: bool = False,
+) -> pl.LazyFrame:
+    """
+    Build one lazy per-person group_by shared by the identity and fill analyses.
+
+    Returns personName, total_records, the distinct count of each identity
+    field and the missing count ({field}_nulls) of each fill field present in
+    df. Identity counts expect empty strings already converted with
+    empty_strings_to_null; fill counts treat empty strings as missing.
+
+    With conflicts_only, each identity column is instead a boolean flag for
+    "more than one distinct value (null included)", which avoids building a
+    per-person hash set for ordered (e.g. date) fields.
+    """
+    lf = df.lazy()
+    schema = lf.collect_schema()
+    identity_fields = [f for f in identity_fields if f in schema]
+    fill_fields = [f for f in fill_fields if f in schema]
+
+    def identity_expr(field: str) -> pl.Expr:
+        col = pl.col(field)
+        if not conflicts_only:
+            return col.n_unique()
+        if schema[field] in (pl.Utf8, pl.Categorical):
+            return (col.n_unique() > 1).alias(field)
+        # Ordered values conflict when they differ, or mix values and nulls
+        nulls = col.null_count()
+        return (
+            (col.min() != col.max()).fill_null(False)
+            | ((nulls > 0) & (nulls < pl.len()))
+        ).alias(field)
+
+    # Missing values per field: nulls, plus empty strings in string columns,
+    # counted in one fused predicate instead of a rewrite then a null_count
+    missing_exprs = [
+        (
+            (pl.col(f).is_null() | (pl.col(f) == "")).sum()
+            if schema[f] in (pl.Utf8, pl.Categorical)
+            else pl.col(f).null_count()
+        ).alias(f"{f}_nulls")
+        for f in fill_fields
+    ]
+
+    return lf.group_by("personName").agg(
+        [
+            pl.len().alias("total_records"),
+            *[identity_expr(f) for f in identity_fields],
+            *missing_exprs,
+        ]
+    )
+
+
+def identity_unique_counts_query(df: Union[pl.DataFrame, pl.LazyFrame]) -> pl.LazyFrame:
+    """
+    Build the lazy per-person distinct value counts of the identity fields.
+
+    Expects empty strings already converted with empty_strings_to_null, so
+    callers normalize once for every analysis they run.
+    """
+    return person_field_counts_query(df, fill_fields=[]).drop("total_records")
+
+
+def fillable_null_totals(
+    person_counts: Union[pl.DataFrame, pl.LazyFrame],
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Reduce per-person fill null counts to one row of totals per fill field"""
+    names = person_counts.collect_schema().names()
+    fields = [f for f in FILL_FIELDS if f"{f}_nulls" in names]
+
+    totals_expr = []
+    for field in fields:
+        nulls = pl.col(f"{field}_nulls")
+        # Missing values are compared against the person's non-missing count,
+        # as with the pl.col(field).count() these stats were defined on
+        present = pl.col("total_records") - nulls
+        totals_expr += [
+            nulls.sum().alias(f"{field}_total_nulls"),
+            ((nulls > 0) & (nulls < present)).sum().alias(f"{field}_partial"),
+            (nulls == present).sum().alias(f"{field}_missing"),
+        ]
+
+    return person_counts.select([*totals_expr, pl.len().alias("total_people")])
+
+
+def fillable_null_query(df: Union[pl.DataFrame, pl.LazyFrame]) -> pl.LazyFrame:
+    """Build the lazy one-row frame of fillable null totals per fill field"""
+    return fillable_null_totals(person_field_counts_query(df, identity_fields=[]))
+
+
+def summarize_fillable_nulls(totals: pl.DataFrame) -> Dict[str, Dict]:
+    """Turn the collected fillable_null_query frame into per-field stats"""
+    row = totals.row(0, named=True)
+    fields = [f for f in FILL_FIELDS if f"{f}_total_nulls" in row]
+
+    return {
+        field: {
+            "total_nulls": row[f"{field}_total_nulls"],
+            "partially_fillable_people": row[f"{field}_partial"],
+            "completely_missing_people": row[f"{field}_missing"],
+            "total_people": row["total_people"],
+        }
+        for field in fields
+    }
+
+
+def fillable_null_stats(df: Union[pl.DataFrame, pl.LazyFrame]) -> Dict[str, Dict]:
+    """
+    Summarize forward/backward fillable nulls per fill field in one group_by.
+
+    Empty strings count as nulls. For each field present in df, returns
+    total_nulls, partially_fillable_people (some data, some nulls),
+    completely_missing_people (no data) and total_people.
+    """
+    if not any(f in df.collect_schema() for f in FILL_FIELDS):
+        return {}
+
+    return summarize_fillable_nulls(fillable_null_query(df).collect(engine="streaming"))
+
+
 def analyze_repair_impact(
     original: pl.DataFrame, repaired: pl.DataFrame, repair_type: str = "unknown"
 ) -> Dict:
@@ -732,8 +1016,14 @@ def analyze_repair_impact(
 
     # Field-specific analysis depends on repair type
     if repair_type == "0th_order":
-        original_issues = count_0th_order_issues(original)
-        repaired_issues = count_0th_order_issues(repaired)
+        # Count both frames in one collect
+        original_issues, repaired_issues = (
+            counts.row(0, named=True)
+            for counts in pl.collect_all(
+                [count_0th_order_query(original), count_0th_order_query(repaired)],
+                engine="streaming",
+            )
+        )
 
         stats.update(
             {
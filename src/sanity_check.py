@@ -9,62 +9,88 @@ from datetime import datetime
 import json
 from data_lib import load_data
 from repairs_lib import (
-    count_0th_order_issues,
+    UNKNOWN_RE,
+    EDGE_WHITESPACE_RE,
+    IDENTITY_FIELDS,
+    FILL_FIELDS,
+    empty_strings_to_null,
+    identity_unique_counts_query,
+    fillable_null_stats,
+    count_0th_order_query,
     analyze_duplicates,
     clean_whitespace_and_unknowns,
     repair_identity_consistency,
     repair_second_order_fields,
     repair_deduplication,
+    deduplication_counts_query,
+    report_deduplication,
 )
 
 pl.enable_string_cache()
 
+# Columns the analyses read; the remaining value columns are never touched
+ANALYSIS_COLUMNS = {
+    "billionaires": [
+        "date", "personName", "lastName", "birthDate", "gender",
+        "countryOfCitizenship", "city", "state", "source", "industries",
+        "finalWorth",
+    ],
+    "assets": [
+        "date", "personName", "companyName", "currencyCode", "exchange",
+        "exchangeRate", "exerciseOptionPrice", "interactive", "numberOfShares",
+        "ticker",
+    ],
+}
+
 
 def analyze_0th_order_issues(df, dataset_type):
     """Analyze 0th order issues (whitespace, unknowns)"""
     print(f"\n🧹 0TH ORDER ANALYSIS - {dataset_type.upper()}")
     print("=" * 60)
     
-    issues = count_0th_order_issues(df)
-    
-    print(f"Whitespace issues: {issues['whitespace']:,}")
-    print(f"Unknown variations: {issues['unknown']:,}")
+    lf = df.lazy()
     
-    # Show examples of problematic values
-    string_cols = [
-        col for col, dtype in df.schema.items() if dtype in (pl.Utf8, pl.Categorical)
-    ]
+    # Examples of problematic values
+    string_cols = lf.select(pl.col(pl.Utf8, pl.Categorical)).collect_schema().names()
     
-    examples = {}
+    queries = {}
     for col in string_cols[:5]:  # Check first 5 string columns
         col_str = pl.col(col).cast(pl.Utf8)
         
         # Find whitespace issues
-        ws_examples = df.filter(
-            col_str.is_not_null() & (col_str != col_str.str.strip_chars())
+        queries[f"{col}_whitespace"] = lf.filter(
+            col_str.is_not_null() & col_str.str.contains(EDGE_WHITESPACE_RE)
         ).select(col).unique().limit(3)
         
-        if len(ws_examples) > 0:
-            examples[f"{col}_whitespace"] = ws_examples[col].to_list()
-        
         # Find unknown variations
-        unk_examples = df.filter(
-            col_str.is_not_null() & col_str.str.contains(r"(?i)^(unknown|unknown_-?\d+)$")
+        queries[f"{col}_unknown"] = lf.filter(
+            col_str.is_not_null() & col_str.str.contains(UNKNOWN_RE)
         ).select(col).unique().limit(3)
-        
-        if len(unk_examples) > 0:
-            examples[f"{col}_unknown"] = unk_examples[col].to_list()
+    
+    # Run the issue counts and all example queries together in one collect
+    counts, *found_examples = pl.collect_all(
+        [count_0th_order_query(lf), *queries.values()]
+    )
+    issues = counts.row(0, named=True)
+    
+    print(f"Whitespace issues: {issues['whitespace']:,}")
+    print(f"Unknown variations: {issues['unknown']:,}")
+    
+    examples = {}
+    for key, found in zip(queries, found_examples):
+        if len(found) > 0:
+            examples[key] = [row[0] for row in found.iter_rows()]
     
     if examples:
-        print("\nExample problematic values:")
-        for key, values in examples.items():
-            print(f"  {key}: {values}")
+        lines = ["\nExample problematic values:"]
+        lines += [f"  {key}: {values}" for key, values in examples.items()]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     return issues
 
 
 def analyze_1st_order_issues(df, dataset_type):
-    """Analyze 1st order issues (identity inconsistencies)"""
+    """Analyze 1st order issues (identity inconsistencies) on empty-string-cleaned data"""
     print(f"\n🔍 1ST ORDER ANALYSIS - {dataset_type.upper()}")
     print("=" * 60)
     
@@ -73,77 +99,73 @@ def analyze_1st_order_issues(df, dataset_type):
         return {}
     
     # Check for identity inconsistencies
-    identity_fields = ["lastName", "birthDate", "gender"]
     inconsistencies = {}
     
-    for field in identity_fields:
-        if field not in df.columns:
+    # Count distinct values of every field per person in one group_by
+    # (process_dataset has already turned empty strings into nulls)
+    unique_counts = identity_unique_counts_query(df).collect(engine="streaming")
+    
+    for field in IDENTITY_FIELDS:
+        if field not in unique_counts.columns:
             inconsistencies[field] = 0
             continue
-            
-        # Clean empty strings first (only for string columns)
-        field_dtype = df.schema[field]
-        if field_dtype in [pl.Utf8, pl.Categorical]:
-            df_clean = df.with_columns(
-                pl.when(pl.col(field) == "").then(None).otherwise(pl.col(field)).alias(field)
-            )
-        else:
-            # For non-string columns (like Date), use as-is
-            df_clean = df
         
         # Find people with multiple values for this field
         conflicts = (
-            df_clean.group_by("personName")
-            .agg(pl.col(field).n_unique().alias("unique_count"))
+            unique_counts.select(["personName", pl.col(field).alias("unique_count")])
             .filter(pl.col("unique_count") > 1)
         )
         
-        inconsistencies[field] = len(conflicts)
-        print(f"{field} inconsistencies: {len(conflicts):,} people")
+        conflict_count = conflicts.height
+        inconsistencies[field] = conflict_count
+        print(f"{field} inconsistencies: {conflict_count:,} people")
         
         # Show examples with detailed conflict information
-        if len(conflicts) > 0:
+        if conflict_count > 0:
             print(f"  Examples (showing up to 5):")
             
             # Get the top conflicting person names with their unique counts
             top_conflicts = conflicts.head(5)
+
+            # Get unique values with their first occurrence date, restricted
+            # to the conflicting people we display
+            value_stats = (
+                df.lazy()
+                .join(top_conflicts.lazy().select("personName"), on="personName", how="semi")
+                .group_by(["personName", field])
+                .agg([
+                    pl.len().alias("count"),
+                    pl.col("date").min().alias("first_seen")
+                ])
+                .sort(["personName", "first_seen"])
+                .collect(engine="streaming")
+            )
             
-            for row in top_conflicts.iter_rows(named=True):
-                name = row["personName"]
-                unique_count = row["unique_count"]
-                
-                # Get all records for this person to see the actual values
-                person_data = df_clean.filter(pl.col("personName") == name).select([field, "date"])
-                
-                # Get unique values with their first occurrence date
-                unique_values = (
-                    person_data
-                    .group_by(field)
-                    .agg([
-                        pl.count().alias("count"),
-                        pl.col("date").min().alias("first_seen")
-                    ])
-                    .sort("first_seen")
-                )
-                
-                print(f"    {name} (has {unique_count} different values):")
-                for val_row in unique_values.iter_rows(named=True):
-                    val = val_row[field]
-                    count = val_row["count"]
-                    first_seen = val_row["first_seen"]
-                    
+            # Split once per person so each displayed name is a dict lookup
+            values_by_person = value_stats.partition_by("personName", as_dict=True)
+
+            # Collect the example lines and write them out in one go
+            lines = []
+            for name, unique_count in top_conflicts.iter_rows():
+                # Already in first-seen order from the sort above
+                unique_values = values_by_person[(name,)].select([field, "count", "first_seen"])
+
+                lines.append(f"    {name} (has {unique_count} different values):")
+                for val, count, first_seen in unique_values.iter_rows():
                     if val is None:
                         val_str = "NULL"
                     else:
                         val_str = f"'{val}'"
                     
-                    print(f"      {val_str}: {count} records (first seen: {first_seen})")
+                    lines.append(f"      {val_str}: {count} records (first seen: {first_seen})")
+            
+            sys.stdout.write("\n".join(lines) + "\n")
     
     return inconsistencies
 
 
 def analyze_2nd_order_issues(df, dataset_type):
-    """Analyze 2nd order issues (forward/backward fillable data)"""
+    """Analyze 2nd order issues (forward/backward fillable data; df has empty strings nulled)"""
     print(f"\n🔧 2ND ORDER ANALYSIS - {dataset_type.upper()}")
     print("=" * 60)
     
@@ -151,55 +173,34 @@ def analyze_2nd_order_issues(df, dataset_type):
         print("⚠️ 2nd order analysis only applies to billionaires dataset")
         return {}
     
-    # Fields that can be forward/backward filled
-    fill_fields = ["countryOfCitizenship", "city", "state", "source", "industries"]
-    existing_fields = [f for f in fill_fields if f in df.columns]
-    
-    fillable_stats = {}
+    # A column's null_count is stored metadata, so fields without any nulls
+    # are left out of the group_by instead of being scanned for nothing
+    fields = [f for f in FILL_FIELDS if f in df.columns]
+    complete = [f for f in fields if df[f].null_count() == 0]
     
-    for field in existing_fields:
-        # Clean empty strings (only for string fields)
-        field_dtype = df.schema[field]
-        if field_dtype in [pl.Utf8, pl.Categorical]:
-            df_clean = df.with_columns(
-                pl.when(pl.col(field) == "").then(None).otherwise(pl.col(field)).alias(field)
-            )
-        else:
-            df_clean = df
-        
-        # Count nulls per person
-        person_stats = (
-            df_clean.group_by("personName")
-            .agg([
-                pl.col(field).count().alias("total_records"),
-                pl.col(field).null_count().alias("null_records"),
-            ])
-            .with_columns(
-                (pl.col("null_records") / pl.col("total_records") * 100).alias("null_percentage")
-            )
-        )
-        
-        # People who have some data but missing some
-        partially_fillable = person_stats.filter(
-            (pl.col("null_records") > 0) & (pl.col("null_records") < pl.col("total_records"))
-        )
-        
-        # People who have no data at all
-        completely_missing = person_stats.filter(
-            pl.col("null_records") == pl.col("total_records")
-        )
-        
-        fillable_stats[field] = {
-            "total_nulls": df_clean[field].null_count(),
-            "partially_fillable_people": len(partially_fillable),
-            "completely_missing_people": len(completely_missing),
-            "total_people": len(person_stats),
-        }
-        
-        print(f"{field}:")
-        print(f"  Total null values: {fillable_stats[field]['total_nulls']:,}")
-        print(f"  People with partial data: {fillable_stats[field]['partially_fillable_people']:,}")
-        print(f"  People with no data: {fillable_stats[field]['completely_missing_people']:,}")
+    # Null and fillable-people stats for the other fill fields in one group_by
+    computed = fillable_null_stats(df.drop(complete))
+    total_people = (
+        next(iter(computed.values()))["total_people"] if computed
+        else df["personName"].n_unique()
+    )
+    no_nulls = {
+        "total_nulls": 0,
+        "partially_fillable_people": 0,
+        "completely_missing_people": 0,
+        "total_people": total_people,
+    }
+    fillable_stats = {f: computed.get(f, no_nulls) for f in fields}
+    
+    # Collect the per-field lines and write them out in one go
+    lines = []
+    for field in fillable_stats:
+        lines.append(f"{field}:")
+        lines.append(f"  Total null values: {fillable_stats[field]['total_nulls']:,}")
+        lines.append(f"  People with partial data: {fillable_stats[field]['partially_fillable_people']:,}")
+        lines.append(f"  People with no data: {fillable_stats[field]['completely_missing_people']:,}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     return fillable_stats
 
@@ -211,25 +212,29 @@ def simulate_repair_impact(df, dataset_type):
     
     original_count = len(df)
     
-    # Simulate 0th order
-    cleaned = clean_whitespace_and_unknowns(df, None)
-    after_0th = len(cleaned)
+    # Build every later stage lazily, since only their record counts are
+    # needed; the in-memory frame is cleaned on its distinct categories first
+    cleaned = clean_whitespace_and_unknowns(df, None).lazy()
     
     # Simulate 1st and 2nd order for billionaires
     if dataset_type == "billionaires":
         identity_repaired = repair_identity_consistency(cleaned)
-        after_1st = len(identity_repaired)
-        
         fill_repaired = repair_second_order_fields(identity_repaired)
-        after_2nd = len(fill_repaired)
     else:
-        after_1st = after_0th
-        after_2nd = after_0th
+        identity_repaired = cleaned
         fill_repaired = cleaned
     
     # Simulate deduplication
     deduplicated = repair_deduplication(fill_repaired, dataset_type)
-    after_3rd = len(deduplicated)
+    
+    # Count all stages in one collect so shared stages are computed once
+    stages = [cleaned, identity_repaired, fill_repaired, deduplicated]
+    *stage_counts, dedup_counts = pl.collect_all(
+        [stage.select(pl.len()) for stage in stages]
+        + [deduplication_counts_query(fill_repaired, dataset_type)]
+    )
+    after_0th, after_1st, after_2nd, after_3rd = [counts.item() for counts in stage_counts]
+    report_deduplication(dedup_counts, after_3rd)
     
     print(f"Original records: {original_count:,}")
     print(f"After 0th order (clean): {after_0th:,} (removed: {original_count - after_0th:,})")
@@ -311,7 +316,7 @@ def process_dataset(file_path, dataset_type, output_dir=None):
         return None
     
     # Load data
-    df = load_data(file_path, dataset_type)
+    df = load_data(file_path, dataset_type, ANALYSIS_COLUMNS[dataset_type])
     print(f"📈 Loaded {len(df):,} records")
     
     results = {"dataset_type": dataset_type, "file_path": str(file_path)}
@@ -320,8 +325,11 @@ def process_dataset(file_path, dataset_type, output_dir=None):
     results["0th_order"] = analyze_0th_order_issues(df, dataset_type)
     
     if dataset_type == "billionaires":
-        results["1st_order"] = analyze_1st_order_issues(df, dataset_type)
-        results["2nd_order"] = analyze_2nd_order_issues(df, dataset_type)
+        # Clean empty strings once for both the 1st and 2nd order analyses
+        df_clean = empty_strings_to_null(df, IDENTITY_FIELDS + FILL_FIELDS)
+        
+        results["1st_order"] = analyze_1st_order_issues(df_clean, dataset_type)
+        results["2nd_order"] = analyze_2nd_order_issues(df_clean, dataset_type)
     
     results["duplicates"] = analyze_duplicates(df, dataset_type)
     results["repair_impact"] = simulate_repair_impact(df, dataset_type)
@@ -334,9 +342,9 @@ def process_dataset(file_path, dataset_type, output_dir=None):
         output_path = Path(output_dir) / f"{dataset_type}_analysis_report.json"
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert results to JSON-serializable format
-        json_results = json.dumps(results, indent=2, default=str)
-        output_path.write_text(json_results)
+        # Stream the JSON-serializable results straight to the file
+        with output_path.open("w") as fh:
+            json.dump(results, fh, indent=2, default=str)
         print(f"\n💾 Detailed report saved to: {output_path}")
     
     return results
@@ -379,30 +387,23 @@ def main():
     success = True
     all_results = {}
     
-    # Process billionaires
-    if args.dataset in ["billionaires", "both"]:
-        billionaires_path = data_dir / "billionaires.parquet"
-        if billionaires_path.exists():
-            result = process_dataset(billionaires_path, "billionaires", args.output_dir)
-            if result:
-                all_results["billionaires"] = result
+    # Collect the datasets to analyze
+    jobs = []
+    for dataset_type, label in [("billionaires", "Billionaires"), ("assets", "Assets")]:
+        if args.dataset in [dataset_type, "both"]:
+            path = data_dir / f"{dataset_type}.parquet"
+            if path.exists():
+                jobs.append((path, dataset_type))
             else:
+                print(f"❌ {label} file not found: {path}")
                 success = False
-        else:
-            print(f"❌ Billionaires file not found: {billionaires_path}")
-            success = False
     
-    # Process assets
-    if args.dataset in ["assets", "both"]:
-        assets_path = data_dir / "assets.parquet"
-        if assets_path.exists():
-            result = process_dataset(assets_path, "assets", args.output_dir)
-            if result:
-                all_results["assets"] = result
-            else:
-                success = False
+    # Check one dataset at a time, so only one dataset is in memory at once
+    for path, dataset_type in jobs:
+        result = process_dataset(path, dataset_type, args.output_dir)
+        if result:
+            all_results[dataset_type] = result
         else:
-            print(f"❌ Assets file not found: {assets_path}")
             success = False
     
     # Final summary
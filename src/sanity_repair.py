@@ -3,14 +3,28 @@
 
 import polars as pl
 import argparse
+import os
 from pathlib import Path
 import sys
 from datetime import datetime
 import json
-from data_lib import load_data, save_data
+
+try:
+    import orjson
+except ImportError:  # Optional: only speeds up writing the JSON report
+    orjson = None
+
+from data_lib import load_data, save_data, enforce_schema
 from repairs_lib import (
+    IDENTITY_FIELDS,
+    FILL_FIELDS,
+    empty_strings_to_null,
+    person_field_counts_query,
+    fillable_null_totals,
+    summarize_fillable_nulls,
     repair_all_orders,
-    count_0th_order_issues,
+    repair_all_orders_lazy,
+    count_0th_order_query,
     analyze_duplicates,
     analyze_repair_impact,
 )
@@ -18,123 +32,132 @@ from repairs_lib import (
 pl.enable_string_cache()
 
 
-def analyze_before_repair(df, dataset_type):
-    """Analyze dataset before repairs to establish baseline"""
+def collect_order_metrics(df, dataset_type, orders=("0th", "1st", "2nd")):
+    """Compute the requested 0th, 1st and 2nd order issue counts in one collect over df"""
+    lf = df.lazy()
+    
+    # Normalize empty strings once; the 0th order counts need the raw values
+    lf_clean = empty_strings_to_null(lf, IDENTITY_FIELDS + FILL_FIELDS)
+    queries = {}
+    if "0th" in orders:
+        queries["0th"] = count_0th_order_query(lf)
+    if dataset_type == "billionaires" and ("1st" in orders or "2nd" in orders):
+        # One per-person group_by feeds both the identity and fill metrics
+        queries["people"] = person_field_counts_query(lf_clean, conflicts_only=True)
+    
+    if not queries:
+        return {}
+    
+    # Polars runs all queries together and shares the scan of df
+    frames = dict(zip(queries, pl.collect_all(list(queries.values()), engine="streaming")))
+    
+    metrics = {}
+    if "0th" in frames:
+        metrics["0th"] = frames["0th"].row(0, named=True)
+    if "people" in frames:
+        people = frames["people"]
+        if "1st" in orders:
+            metrics["1st"] = analyze_identity_inconsistencies(people)
+        if "2nd" in orders:
+            metrics["2nd"] = analyze_fillable_nulls(
+                summarize_fillable_nulls(fillable_null_totals(people))
+            )
+    
+    return metrics
+
+
+def analyze_before_repair(df, dataset_type, repair_orders=None):
+    """Analyze dataset before repairs to establish baseline (disabled orders count as zero)"""
     print(f"\n📊 PRE-REPAIR ANALYSIS - {dataset_type.upper()}")
     print("=" * 60)
     
+    if repair_orders is None:
+        repair_orders = {"0th": True, "1st": True, "2nd": True, "3rd": True}
+    
+    total_records = df.height
     stats = {
-        "total_records": len(df),
+        "total_records": total_records,
         "dataset_type": dataset_type,
     }
     
+    # Only scan for the issues the enabled repair orders will act on
+    enabled = [order for order in ("0th", "1st", "2nd") if repair_orders.get(order, True)]
+    metrics = collect_order_metrics(df, dataset_type, enabled)
+    
     # 0th order issues
-    issues_0th = count_0th_order_issues(df)
+    issues_0th = metrics.get("0th", {"whitespace": 0, "unknown": 0})
     stats["0th_order_issues"] = issues_0th
-    print(f"0th order issues: {issues_0th['whitespace']:,} whitespace, {issues_0th['unknown']:,} unknown")
+    if "0th" in metrics:
+        print(f"0th order issues: {issues_0th['whitespace']:,} whitespace, {issues_0th['unknown']:,} unknown")
     
     # Identity inconsistencies (billionaires only)
     if dataset_type == "billionaires":
-        identity_issues = analyze_identity_inconsistencies(df)
+        identity_issues = metrics.get("1st", {field: 0 for field in IDENTITY_FIELDS})
         stats["1st_order_issues"] = identity_issues
-        print(f"1st order issues: {sum(identity_issues.values()):,} identity inconsistencies")
+        if "1st" in metrics:
+            print(f"1st order issues: {sum(identity_issues.values()):,} identity inconsistencies")
         
         # 2nd order fillable nulls
-        fill_issues = analyze_fillable_nulls(df)
+        fill_issues = metrics.get("2nd", {})
         stats["2nd_order_issues"] = fill_issues
-        print(f"2nd order issues: {sum(v['total_nulls'] for v in fill_issues.values()):,} fillable nulls")
+        if "2nd" in metrics:
+            print(f"2nd order issues: {sum(v['total_nulls'] for v in fill_issues.values()):,} fillable nulls")
     
     # Duplicate analysis
-    dup_stats = analyze_duplicates(df, dataset_type)
+    if repair_orders.get("3rd", True):
+        dup_stats = analyze_duplicates(df, dataset_type)
+        print(f"3rd order issues: {dup_stats.get('total_duplicates', 0):,} duplicate records")
+    else:
+        dup_stats = {"dataset_type": dataset_type, "total_records": total_records, "total_duplicates": 0}
     stats["3rd_order_issues"] = dup_stats
-    print(f"3rd order issues: {dup_stats.get('total_duplicates', 0):,} duplicate records")
     
     return stats
 
 
-def analyze_identity_inconsistencies(df):
-    """Analyze identity inconsistencies for 1st order repairs"""
-    identity_fields = ["lastName", "birthDate", "gender"]
-    inconsistencies = {}
-    
-    for field in identity_fields:
-        if field not in df.columns:
-            inconsistencies[field] = 0
-            continue
-            
-        # Clean empty strings first (only for string columns)
-        field_dtype = df.schema[field]
-        if field_dtype in [pl.Utf8, pl.Categorical]:
-            df_clean = df.with_columns(
-                pl.when(pl.col(field) == "").then(None).otherwise(pl.col(field)).alias(field)
-            )
-        else:
-            # For non-string columns (like Date), use as-is
-            df_clean = df
-        
-        # Find people with multiple values for this field
-        conflicts = (
-            df_clean.group_by("personName")
-            .agg(pl.col(field).n_unique().alias("unique_count"))
-            .filter(pl.col("unique_count") > 1)
-        )
-        
-        inconsistencies[field] = len(conflicts)
-    
-    return inconsistencies
+def analyze_identity_inconsistencies(conflicts):
+    """Count people with conflicting identity values from per-person conflict flags"""
+    # People with multiple values for each field
+    return {
+        field: int(conflicts[field].sum()) if field in conflicts.columns else 0
+        for field in IDENTITY_FIELDS
+    }
 
 
-def analyze_fillable_nulls(df):
-    """Analyze fillable nulls for 2nd order repairs"""
-    fill_fields = ["countryOfCitizenship", "city", "state", "source", "industries"]
-    existing_fields = [f for f in fill_fields if f in df.columns]
-    
-    fillable_stats = {}
-    
-    for field in existing_fields:
-        # Clean empty strings (only for string fields)
-        field_dtype = df.schema[field]
-        if field_dtype in [pl.Utf8, pl.Categorical]:
-            df_clean = df.with_columns(
-                pl.when(pl.col(field) == "").then(None).otherwise(pl.col(field)).alias(field)
-            )
-        else:
-            df_clean = df
-        
-        # Count fillable nulls (people who have some data but missing some)
-        person_stats = (
-            df_clean.group_by("personName")
-            .agg([
-                pl.col(field).count().alias("total_records"),
-                pl.col(field).null_count().alias("null_records"),
-            ])
-        )
-        
-        partially_fillable = person_stats.filter(
-            (pl.col("null_records") > 0) & (pl.col("null_records") < pl.col("total_records"))
-        )
-        
-        fillable_stats[field] = {
-            "total_nulls": df_clean[field].null_count(),
-            "fillable_people": len(partially_fillable),
+def analyze_fillable_nulls(fill_stats):
+    """Reduce fillable null stats to the counts tracked by the repair report"""
+    return {
+        field: {
+            "total_nulls": stats["total_nulls"],
+            "fillable_people": stats["partially_fillable_people"],
         }
-    
-    return fillable_stats
+        for field, stats in fill_stats.items()
+    }
 
 
-def analyze_after_repair(original_df, repaired_df, dataset_type, original_stats):
-    """Analyze dataset after repairs to show impact"""
+def analyze_after_repair(repaired_df, dataset_type, original_stats, repair_orders=None):
+    """Analyze dataset after repairs to show impact (relative to original_stats)"""
     print(f"\n📈 POST-REPAIR ANALYSIS - {dataset_type.upper()}")
     print("=" * 60)
     
+    if repair_orders is None:
+        repair_orders = {"0th": True, "1st": True, "2nd": True, "3rd": True}
+    
+    repaired_count = repaired_df.height
     stats = {
-        "total_records": len(repaired_df),
+        "total_records": repaired_count,
         "dataset_type": dataset_type,
-        "records_removed": len(original_df) - len(repaired_df),
+        "records_removed": original_stats["total_records"] - repaired_count,
     }
     
+    # An applied 0th order cleaning strips every whitespace issue and unknown,
+    # and deduplication leaves unique keys, so those "after" counts are known
+    # to be zero; disabled orders were recorded as zero before repair and fix
+    # nothing. Only applied 1st and 2nd order repairs need rescanning
+    applied = [order for order in ("1st", "2nd") if repair_orders.get(order, True)]
+    metrics_after = collect_order_metrics(repaired_df, dataset_type, applied)
+    
     # 0th order improvements
-    issues_0th_after = count_0th_order_issues(repaired_df)
+    issues_0th_after = {"whitespace": 0, "unknown": 0}
     stats["0th_order_fixed"] = {
         "whitespace": original_stats["0th_order_issues"]["whitespace"] - issues_0th_after["whitespace"],
         "unknown": original_stats["0th_order_issues"]["unknown"] - issues_0th_after["unknown"],
@@ -144,7 +167,7 @@ def analyze_after_repair(original_df, repaired_df, dataset_type, original_stats)
     
     # Identity improvements (billionaires only)
     if dataset_type == "billionaires" and "1st_order_issues" in original_stats:
-        identity_after = analyze_identity_inconsistencies(repaired_df)
+        identity_after = metrics_after.get("1st", original_stats["1st_order_issues"])
         stats["1st_order_fixed"] = {}
         total_fixed = 0
         for field in identity_after:
@@ -155,7 +178,7 @@ def analyze_after_repair(original_df, repaired_df, dataset_type, original_stats)
         print(f"1st order fixed: {total_fixed:,} identity inconsistencies")
         
         # 2nd order improvements
-        fill_after = analyze_fillable_nulls(repaired_df)
+        fill_after = metrics_after.get("2nd", original_stats["2nd_order_issues"])
         stats["2nd_order_fixed"] = {}
         total_filled = 0
         for field in fill_after:
@@ -167,7 +190,7 @@ def analyze_after_repair(original_df, repaired_df, dataset_type, original_stats)
         print(f"2nd order fixed: {total_filled:,} null values filled")
     
     # Deduplication improvements
-    dup_after = analyze_duplicates(repaired_df, dataset_type)
+    dup_after = {"total_duplicates": 0}
     duplicates_removed = original_stats["3rd_order_issues"].get("total_duplicates", 0) - dup_after.get("total_duplicates", 0)
     stats["3rd_order_fixed"] = duplicates_removed
     
@@ -186,9 +209,14 @@ def create_backup(file_path, backup_dir):
     backup_name = f"{file_path.stem}_backup_{timestamp}{file_path.suffix}"
     backup_path = backup_dir / backup_name
     
-    # Copy file
-    import shutil
-    shutil.copy2(file_path, backup_path)
+    # Hardlink when possible: save_data writes a new file and replaces the
+    # original, so the link keeps the old contents without copying any bytes
+    try:
+        os.link(file_path, backup_path)
+    except OSError:
+        # Different filesystem or no hardlink support
+        import shutil
+        shutil.copy2(file_path, backup_path)
     
     print(f"💾 Backup created: {backup_path}")
     return backup_path
@@ -200,7 +228,8 @@ def process_dataset(
     output_path=None, 
     backup_dir=None, 
     dry_run=False,
-    repair_orders=None
+    repair_orders=None,
+    streaming=False
 ):
     """Process one dataset with comprehensive repairs"""
     print(f"\n🔧 PROCESSING {dataset_type.upper()}")
@@ -210,51 +239,63 @@ def process_dataset(
         print(f"❌ File not found: {file_path}")
         return None
     
+    if streaming:
+        return stream_dataset(
+            file_path, dataset_type, output_path, backup_dir, dry_run, repair_orders
+        )
+    
     # Load data
     original_df = load_data(file_path, dataset_type)
-    print(f"📊 Loaded {len(original_df):,} records")
+    original_count = original_df.height
+    print(f"📊 Loaded {original_count:,} records")
     
-    if len(original_df) == 0:
+    if original_count == 0:
         print("⚠️ Dataset is empty, skipping repairs")
         return {"status": "empty"}
     
-    # Analyze before repair
-    original_stats = analyze_before_repair(original_df, dataset_type)
+    if repair_orders is None:
+        repair_orders = {"0th": True, "1st": True, "2nd": True, "3rd": True}
     
-    # Create backup if not dry run
+    # Create backup if not dry run, before any analysis or repair work runs
     if not dry_run and backup_dir:
         backup_path = create_backup(file_path, backup_dir)
     
+    # Analyze before repair
+    original_stats = analyze_before_repair(original_df, dataset_type, repair_orders)
+    
     # Apply repairs
     print(f"\n🔧 APPLYING COMPREHENSIVE REPAIRS")
     print("=" * 60)
     
-    if repair_orders is None:
-        repair_orders = {"0th": True, "1st": True, "2nd": True, "3rd": True}
-    
     repaired_df = repair_all_orders(
         original_df,
         dataset_type=dataset_type,
         people_filter=None,  # Apply to all data
         apply_0th=repair_orders.get("0th", True),
-        apply_1st=repair_orders.get("1st", True) and dataset_type == "billionaires",
-        apply_2nd=repair_orders.get("2nd", True) and dataset_type == "billionaires",
+        apply_1st=repair_orders.get("1st", True),  # Only acts on billionaires
+        apply_2nd=repair_orders.get("2nd", True),  # Only acts on billionaires
         apply_3rd=repair_orders.get("3rd", True),
     )
     
+    # Only the cached counts in original_stats are needed from here on, so
+    # release the original frame before analyzing and saving the repaired one
+    del original_df
+    
     # Analyze after repair
-    repair_stats = analyze_after_repair(original_df, repaired_df, dataset_type, original_stats)
+    repair_stats = analyze_after_repair(repaired_df, dataset_type, original_stats, repair_orders)
     
     # Prepare output path
     if output_path is None:
         output_path = file_path
     
+    repaired_count = repaired_df.height
+    
     # Save repaired data
     if dry_run:
-        print(f"\n🔍 DRY RUN - Would save {len(repaired_df):,} records to: {output_path}")
+        print(f"\n🔍 DRY RUN - Would save {repaired_count:,} records to: {output_path}")
     else:
         save_data(repaired_df, output_path, dataset_type)
-        print(f"💾 Saved {len(repaired_df):,} records to: {output_path}")
+        print(f"💾 Saved {repaired_count:,} records to: {output_path}")
     
     # Compile results
     results = {
@@ -273,6 +314,74 @@ def process_dataset(
     return results
 
 
+def stream_dataset(
+    file_path, 
+    dataset_type, 
+    output_path=None, 
+    backup_dir=None, 
+    dry_run=False,
+    repair_orders=None
+):
+    """Repair one dataset as a streaming scan -> repair -> sink, without analyses"""
+    # The pre/post analyses need the data in memory, so only counts are kept
+    lf = enforce_schema(pl.scan_parquet(file_path), dataset_type)
+    original_count = lf.select(pl.len()).collect().item()
+    print(f"📊 Scanning {original_count:,} records (streaming, analyses skipped)")
+    
+    if original_count == 0:
+        print("⚠️ Dataset is empty, skipping repairs")
+        return {"status": "empty"}
+    
+    # Create backup if not dry run
+    if not dry_run and backup_dir:
+        backup_path = create_backup(file_path, backup_dir)
+    
+    print(f"\n🔧 APPLYING COMPREHENSIVE REPAIRS (STREAMING)")
+    print("=" * 60)
+    
+    if repair_orders is None:
+        repair_orders = {"0th": True, "1st": True, "2nd": True, "3rd": True}
+    
+    repaired_lf = repair_all_orders_lazy(
+        lf,
+        dataset_type=dataset_type,
+        people_filter=None,  # Apply to all data
+        apply_0th=repair_orders.get("0th", True),
+        apply_1st=repair_orders.get("1st", True),  # Only acts on billionaires
+        apply_2nd=repair_orders.get("2nd", True),  # Only acts on billionaires
+        apply_3rd=repair_orders.get("3rd", True),
+    )
+    
+    if output_path is None:
+        output_path = file_path
+    
+    if dry_run:
+        repaired_count = repaired_lf.select(pl.len()).collect(engine="streaming").item()
+        print(f"\n🔍 DRY RUN - Would save {repaired_count:,} records to: {output_path}")
+    else:
+        repaired_count = save_data(repaired_lf, output_path, dataset_type)
+        print(f"💾 Saved {repaired_count:,} records to: {output_path}")
+    
+    results = {
+        "dataset_type": dataset_type,
+        "file_path": str(file_path),
+        "output_path": str(output_path),
+        "dry_run": dry_run,
+        "original_stats": {"total_records": original_count, "dataset_type": dataset_type},
+        "repair_stats": {
+            "total_records": repaired_count,
+            "dataset_type": dataset_type,
+            "records_removed": original_count - repaired_count,
+        },
+        "repair_orders_applied": repair_orders,
+    }
+    
+    if not dry_run and backup_dir:
+        results["backup_path"] = str(backup_path)
+    
+    return results
+
+
 def generate_repair_summary(all_results):
     """Generate comprehensive summary of all repairs"""
     print(f"\n📊 COMPREHENSIVE REPAIR SUMMARY")
@@ -364,6 +473,11 @@ def main():
         "--report-dir", 
         help="Directory to save detailed JSON reports"
     )
+    parser.add_argument(
+        "--streaming", 
+        action="store_true", 
+        help="Stream each file through the repairs without loading it (skips analyses)"
+    )
     
     # Repair order controls
     parser.add_argument("--no-0th-order", action="store_true", help="Skip 0th order repairs")
@@ -403,58 +517,37 @@ def main():
     success = True
     all_results = {}
     
-    # Process billionaires
-    if args.dataset in ["billionaires", "both"]:
-        billionaires_path = data_dir / "billionaires.parquet"
-        if billionaires_path.exists():
-            output_path = (
-                data_dir / f"billionaires{args.output_suffix}.parquet" 
-                if args.output_suffix 
-                else billionaires_path
-            )
-            
-            result = process_dataset(
-                billionaires_path, 
-                "billionaires",
-                output_path,
-                args.backup_dir if not args.no_backup else None,
-                args.dry_run,
-                repair_orders
-            )
-            
-            if result:
-                all_results["billionaires"] = result
+    # Collect the datasets to repair
+    jobs = []
+    for dataset_type, label in [("billionaires", "Billionaires"), ("assets", "Assets")]:
+        if args.dataset in [dataset_type, "both"]:
+            path = data_dir / f"{dataset_type}.parquet"
+            if path.exists():
+                output_path = (
+                    data_dir / f"{dataset_type}{args.output_suffix}.parquet" 
+                    if args.output_suffix 
+                    else path
+                )
+                jobs.append((path, dataset_type, output_path))
             else:
+                print(f"❌ {label} file not found: {path}")
                 success = False
-        else:
-            print(f"❌ Billionaires file not found: {billionaires_path}")
-            success = False
     
-    # Process assets
-    if args.dataset in ["assets", "both"]:
-        assets_path = data_dir / "assets.parquet"
-        if assets_path.exists():
-            output_path = (
-                data_dir / f"assets{args.output_suffix}.parquet" 
-                if args.output_suffix 
-                else assets_path
-            )
-            
-            result = process_dataset(
-                assets_path, 
-                "assets",
-                output_path,
-                args.backup_dir if not args.no_backup else None,
-                args.dry_run,
-                repair_orders
-            )
-            
-            if result:
-                all_results["assets"] = result
-            else:
-                success = False
+    # Repair one dataset at a time, so only one dataset is in memory at once
+    for path, dataset_type, output_path in jobs:
+        result = process_dataset(
+            path, 
+            dataset_type,
+            output_path,
+            args.backup_dir if not args.no_backup else None,
+            args.dry_run,
+            repair_orders,
+            args.streaming
+        )
+        
+        if result:
+            all_results[dataset_type] = result
         else:
-            print(f"❌ Assets file not found: {assets_path}")
             success = False
     
     # Generate summary and save reports
@@ -470,8 +563,13 @@ def main():
             report_path = report_dir / f"repair_report_{timestamp}.json"
             
             # Convert to JSON-serializable format
-            json_results = json.dumps(all_results, indent=2, default=str)
-            report_path.write_text(json_results)
+            if orjson is not None:
+                report_path.write_bytes(
+                    orjson.dumps(all_results, option=orjson.OPT_INDENT_2, default=str)
+                )
+            else:
+                json_results = json.dumps(all_results, indent=2, default=str)
+                report_path.write_text(json_results)
             print(f"\n📄 Detailed report saved to: {report_path}")
     
     # Final status